@@ -4,25 +4,44 @@ import json
 import datetime
 import numpy as np
 import time
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty
 from threading import Thread
 from rich import print
 
+from data_utils.json_utils import json_loads
+
+
 class EpisodeWriter():
     def __init__(self, task_dir, frequency=30,
                  image_shape=(480, 640, 3),
-                 data_keys = ['rgb']):
+                 data_keys = ['rgb'],
+                 image_ring=None,
+                 batch_size=8,
+                 json_keys=(),
+                 encode_workers=2):
         """
         image_shape: [width, height, channel]
         state_shape: [29]
         action_shape: [29]
+        image_ring: optional ShmFrameRing; items may then carry the frame seq in 'rgb' instead of an image
+        batch_size: max number of queued items the worker processes per wake-up
+        json_keys: item keys that may hold raw JSON payloads (bytes/str), decoded on the worker thread
+        encode_workers: threads encoding the rgb frames of a batch in parallel (cv2.imencode releases the GIL)
         """
         print("==> EpisodeWriter initializing...\n")
         self.task_dir = task_dir
         self.frequency = frequency
         self.image_shape = image_shape
         self.data_keys = data_keys
+        self.image_ring = image_ring
+        self.batch_size = batch_size
+        self.json_keys = tuple(json_keys)
+        self._json_cache = {}  # key -> (last raw payload, its decoded value)
+        self.encode_pool = ThreadPoolExecutor(max_workers=encode_workers)
+        self._pending_seqs = deque()  # ring seqs of the queued items not written yet, oldest first
         
         self.data = {}
         self.episode_data = []
@@ -102,28 +121,100 @@ class EpisodeWriter():
     def add_item(self, data_dict):
         # Increment the item ID
         self.item_id += 1
-        # Enqueue the item data
-        self.item_data_queue.put(data_dict)
+        # Enqueue a shallow copy, the worker rewrites the item in place and the caller may reuse data_dict
+        item_data = data_dict.copy()
+        rgb = item_data.get('rgb', None)
+        if isinstance(rgb, int):
+            if self._ring_lag() >= self.image_ring.num_slots // 2:
+                # The writer is so far behind that the producer will soon overwrite the frames it
+                # still has to encode, so stop handing out ring slots and copy this frame instead
+                item_data['rgb'] = self.image_ring.view(rgb).copy()
+            else:
+                self._pending_seqs.append(rgb)
+        self.item_data_queue.put(item_data)
+
+    def _ring_lag(self):
+        """Frames published to the image ring since the oldest frame still waiting to be written."""
+        try:
+            return self.image_ring.head - self._pending_seqs[0]
+        except IndexError:  # nothing pending (the worker may empty the deque concurrently)
+            return 0
+
+    def _get_batch(self):
+        """Block for the first queued item, then take whatever else is already queued (up to batch_size)."""
+        batch = [self.item_data_queue.get(timeout=1)]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.item_data_queue.get_nowait())
+            except Empty:
+                break
+        return batch
 
     def process_queue(self):
         while not self.stop_worker or not self.item_data_queue.empty():
             # Process items in the queue
             try:
-                item_data = self.item_data_queue.get(timeout=1)
+                batch = self._get_batch()
+            except Empty:
+                batch = []
+
+            # Start encoding every frame of the batch first, then finish the items in queue order,
+            # so episode_data keeps the recording order while the encodes overlap
+            encoded = [self._submit_encode(item_data) for item_data in batch]
+            for item_data, encoded_rgb in zip(batch, encoded):
+                holds_seq = isinstance(item_data.get('rgb', None), int)
                 try:
-                    self._process_item_data(item_data)
+                    self._process_item_data(item_data, encoded_rgb)
                 except Exception as e:
                     print(f"Error processing item_data (idx={item_data['idx']}): {e}")
+                if holds_seq:
+                    self._pending_seqs.popleft()
                 self.item_data_queue.task_done()
-            except Empty:
-                pass
+            if batch:
+                curent_record_time = time.time()
+                print(f"==> episode_id:{self.episode_id}  item_id:{batch[-1]['idx']}  batch:{len(batch)}  current_time:{curent_record_time}")
         
             # Check if save_episode was triggered
             if self.need_save and self.item_data_queue.empty():
                 self._save_episode()
 
-    def _process_item_data(self, item_data):
+    def _encode_rgb(self, rgb):
+        """JPEG-encode one frame; an int is a frame seq in the shared image ring and is encoded straight from the slot."""
+        if isinstance(rgb, int):
+            success, buf = cv2.imencode('.jpg', self.image_ring.view(rgb))
+            # Check after encoding, the producer may have overwritten the slot meanwhile;
+            # a frame that is not the recorded one is dropped rather than saved under this idx
+            if not self.image_ring.is_valid(rgb):
+                print(f"Warning: rgb frame {rgb} was overwritten before it was saved, dropping it (writer is lagging).")
+                return False, None
+            return success, buf
+        return cv2.imencode('.jpg', rgb)
+
+    def _submit_encode(self, item_data):
+        rgb = item_data.get('rgb', None)
+        if rgb is None:
+            return None
+        return self.encode_pool.submit(self._encode_rgb, rgb)
+
+    def _decode_json_fields(self, item_data):
+        """Decode raw JSON payloads in place, reusing the last result while the payload object is unchanged."""
+        for key in self.json_keys:
+            raw = item_data.get(key, None)
+            if not isinstance(raw, (bytes, str)):
+                continue
+            cached_raw, decoded = self._json_cache.get(key, (None, None))
+            if raw is not cached_raw:
+                try:
+                    decoded = json_loads(raw)
+                except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+                    print(f"Warning: Failed to decode JSON for {key} (idx={item_data['idx']})")
+                    decoded = None
+                self._json_cache[key] = (raw, decoded)
+            item_data[key] = decoded
+
+    def _process_item_data(self, item_data, encoded_rgb=None):
         idx = item_data['idx']
+        self._decode_json_fields(item_data)
 
         # vision
         rgb = item_data.get('rgb', None)
@@ -151,9 +242,15 @@ class EpisodeWriter():
         if rgb is not None:
             color_name = f'{str(idx).zfill(6)}.jpg'
             save_path = os.path.join(self.rgb_dir, color_name)
-            if not cv2.imwrite(save_path, rgb):
+            if encoded_rgb is None:
+                encoded_rgb = self.encode_pool.submit(self._encode_rgb, rgb)
+            success, buf = encoded_rgb.result()
+            if success:
+                buf.tofile(save_path)
+                item_data['rgb'] = str(Path(save_path).relative_to(Path(self.json_path).parent))
+            else:
                 print(f"Failed to save rgb image.")
-            item_data['rgb'] = str(Path(save_path).relative_to(Path(self.json_path).parent))
+                item_data['rgb'] = None
             
                 
         # state and action are directly saved to the episode_data
@@ -182,9 +279,6 @@ class EpisodeWriter():
         # Update episode data
         self.episode_data.append(item_data)
 
-        curent_record_time = time.time()
-        print(f"==> episode_id:{self.episode_id}  item_id:{self.item_id}  current_time:{curent_record_time}")
-
     def save_episode(self):
         """
         Trigger the save operation. This sets the save flag, and the process_queue thread will handle it.
@@ -215,4 +309,5 @@ class EpisodeWriter():
         while not self.is_available:
             time.sleep(0.01)
         self.stop_worker = True
-        self.worker_thread.join()
\ No newline at end of file
+        self.worker_thread.join()
+        self.encode_pool.shutdown()
\ No newline at end of file
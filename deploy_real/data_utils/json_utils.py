@@ -0,0 +1,12 @@
+"""
+JSON decoding for the Redis payloads, using orjson when it is installed.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses the JSON written by the producers several times faster than json
+json_loads = orjson.loads if orjson is not None else json.loads
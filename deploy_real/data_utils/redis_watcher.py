@@ -0,0 +1,84 @@
+"""
+Redis key change tracking based on keyspace notifications.
+Lets a polling consumer re-read only the keys that were written since its last poll.
+"""
+import threading
+
+import redis
+from rich import print
+
+
+class RedisKeyWatcher:
+    """
+    Subscribe to keyspace notifications for a fixed set of keys and collect the ones that changed.
+
+    If notifications cannot be enabled on the server (e.g. CONFIG is disabled), every key is
+    reported as changed on each poll, which is the same as plain polling.
+    """
+
+    # K: keyspace channel, $: string commands (SET), g: generic commands (DEL, EXPIRE, ...)
+    REQUIRED_EVENT_FLAGS = "K$g"
+
+    def __init__(self, redis_client, keys, db=0):
+        """
+        Args:
+            redis_client: redis.Redis client used for CONFIG and the pubsub connection
+            keys: Redis keys to watch
+            db: Redis database index of the keys
+        """
+        self.keys = tuple(keys)
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._dirty = set(self.keys)  # nothing has been read yet
+        self._channel_prefix = f"__keyspace@{db}__:"
+        self._pubsub = None
+        self._thread = None
+
+        try:
+            self._enable_notifications(redis_client)
+            self._pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self._channel_prefix + key: self._on_event for key in self.keys})
+            self._thread = self._pubsub.run_in_thread(sleep_time=0.01, daemon=True)
+            self.enabled = True
+            print(f"[RedisKeyWatcher] Watching {len(self.keys)} keys via keyspace notifications")
+        except redis.RedisError as e:
+            print(f"[RedisKeyWatcher] Keyspace notifications unavailable ({e}), polling all keys")
+
+    def _enable_notifications(self, redis_client):
+        """Add the required flags to notify-keyspace-events, keeping whatever is already configured."""
+        current = redis_client.config_get("notify-keyspace-events").get("notify-keyspace-events", "")
+        missing = "".join(flag for flag in self.REQUIRED_EVENT_FLAGS if flag not in current)
+        if missing:
+            redis_client.config_set("notify-keyspace-events", current + missing)
+
+    def _on_event(self, message):
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        with self._lock:
+            self._dirty.add(channel[len(self._channel_prefix):])
+
+    def pop_changed(self):
+        """Return the watched keys (in watch order) changed since the last call and clear them."""
+        if self.enabled and not self._thread.is_alive():
+            # The pubsub thread exits on connection errors (e.g. a Redis restart) and no further
+            # notifications would arrive, so fall back to reporting every key from now on
+            self.enabled = False
+            print("[RedisKeyWatcher] Notification thread stopped, polling all keys")
+        if not self.enabled:
+            return self.keys
+        with self._lock:
+            changed = tuple(key for key in self.keys if key in self._dirty)
+            self._dirty.clear()
+        return changed
+
+    def mark_changed(self, keys):
+        """Flag keys to be re-read on the next poll, e.g. after a failed read."""
+        with self._lock:
+            self._dirty.update(keys)
+
+    def close(self):
+        if self._thread is not None:
+            self._thread.stop()
+        if self._pubsub is not None:
+            self._pubsub.close()
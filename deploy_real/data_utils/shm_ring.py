@@ -0,0 +1,87 @@
+"""
+Shared-memory ring buffer of fixed-shape frames for one producer and one consumer.
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class ShmFrameRing:
+    """
+    Ring of `num_slots` fixed-shape frames stored in a single shared memory block.
+
+    Layout: [head (uint64) + padding][slot 0][slot 1]...[slot num_slots-1]
+
+    `head` counts the frames published so far and frame `seq` lives in slot `seq % num_slots`
+    until the producer wraps around to that slot again. The producer never waits for the
+    consumer, so a consumer that keeps a frame view for a while (e.g. to encode it) must check
+    `is_valid(seq)` after using it, like the read side of a seqlock.
+    """
+
+    HEADER_BYTES = 64  # keeps every slot cache-line aligned
+
+    def __init__(self, frame_shape, num_slots=32, dtype=np.uint8, name=None):
+        """
+        Args:
+            frame_shape: shape of one frame, e.g. (H, W, C)
+            num_slots: number of frames kept before the producer overwrites the oldest one
+            dtype: frame dtype
+            name: name of an existing ring to attach to; a new ring is created when None
+        """
+        self.frame_shape = tuple(frame_shape)
+        self.num_slots = num_slots
+        self.dtype = np.dtype(dtype)
+        self.frame_bytes = int(np.prod(self.frame_shape)) * self.dtype.itemsize
+
+        self.is_owner = name is None
+        if self.is_owner:
+            size = self.HEADER_BYTES + self.num_slots * self.frame_bytes
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self._header = np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf)
+        self._slots = np.ndarray((self.num_slots,) + self.frame_shape, dtype=self.dtype,
+                                 buffer=self.shm.buf, offset=self.HEADER_BYTES)
+        if self.is_owner:
+            self._header[0] = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def head(self):
+        """Number of frames published so far."""
+        return int(self._header[0])
+
+    def publish(self, frame):
+        """Copy `frame` into the next slot and make it visible to the consumer. Returns its seq."""
+        seq = self.head
+        np.copyto(self._slots[seq % self.num_slots], frame)
+        # Publish only after the slot is fully written
+        self._header[0] = seq + 1
+        return seq
+
+    def latest(self):
+        """Return (seq, view) of the newest frame, or (-1, None) if nothing was published yet."""
+        seq = self.head - 1
+        if seq < 0:
+            return -1, None
+        return seq, self._slots[seq % self.num_slots]
+
+    def view(self, seq):
+        """Zero-copy view of the slot holding frame `seq`."""
+        return self._slots[seq % self.num_slots]
+
+    def is_valid(self, seq):
+        """True while frame `seq` has not been (even partially) overwritten by the producer."""
+        return 0 <= seq and self.head - seq < self.num_slots
+
+    def close(self):
+        """Release the mapping; the creating side also unlinks the shared memory block."""
+        if self.is_owner:
+            self.shm.unlink()
+        # Drop our own buffer exports first, otherwise SharedMemory.close() raises BufferError
+        del self._header, self._slots
+        self.shm.close()
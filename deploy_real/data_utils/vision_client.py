@@ -20,6 +20,7 @@ class VisionClient:
         
         img_shape=None,
         img_shm_name=None,
+        img_ring_slots=None,
         depth_shape=None,
         depth_shm_name=None,
         
@@ -41,6 +42,9 @@ class VisionClient:
             Default resolution is 480x640 (Height x Width).
         img_shm_name : str or None
             Shared memory name for RGB image (optional).
+        img_ring_slots : int or None
+            If set, img_shm_name names a ShmFrameRing with this many slots and every
+            received frame is published to the ring instead of overwriting a single image.
         depth_shape : tuple or None
             Shape (H, W) for depth image shared memory array (optional).
             Default resolution is 480x640.
@@ -69,9 +73,14 @@ class VisionClient:
         self.img_shape = img_shape
         self.img_shm_name = img_shm_name
         self.img_shm_enabled = False
+        self.img_ring = None
         if (self.img_shape is not None) and (self.img_shm_name is not None):
-            self.img_shm = shared_memory.SharedMemory(name=self.img_shm_name)
-            self.img_array = np.ndarray(self.img_shape, dtype=np.uint8, buffer=self.img_shm.buf)
+            if img_ring_slots:
+                from data_utils.shm_ring import ShmFrameRing
+                self.img_ring = ShmFrameRing(self.img_shape, img_ring_slots, name=self.img_shm_name)
+            else:
+                self.img_shm = shared_memory.SharedMemory(name=self.img_shm_name)
+                self.img_array = np.ndarray(self.img_shape, dtype=np.uint8, buffer=self.img_shm.buf)
             self.img_shm_enabled = True
 
         # Optional shared memory for depth image (single camera)
@@ -125,12 +134,14 @@ class VisionClient:
 
         # If shared memory is enabled for RGB images, copy it over
         if self.img_shm_enabled and self.img_shape is not None:
-            if color_img.shape == self.img_shape:
-                np.copyto(self.img_array, color_img)
-            else:
+            if color_img.shape != self.img_shape:
                 # If shape doesn't match exactly, you might need a crop/resizing.
                 h, w = self.img_shape[0], self.img_shape[1]
-                np.copyto(self.img_array, color_img[:h, :w])
+                color_img = color_img[:h, :w]
+            if self.img_ring is not None:
+                self.img_ring.publish(color_img)
+            else:
+                np.copyto(self.img_array, color_img)
 
         # If you want to display the image
         if self.image_show:
@@ -25,14 +25,18 @@ kTopicDex3LeftState = "rt/dex3/left/state"
 kTopicDex3RightState = "rt/dex3/right/state"
 
 
-DEFAULT_QPOS_LEFT = DEFAULT_HAND_POSE["unitree_g1"]["left"]["open"]
-DEFAULT_QPOS_RIGHT = DEFAULT_HAND_POSE["unitree_g1"]["right"]["open"]
+# Constant tables are converted to contiguous float32 arrays once at import,
+# so callers can use them directly in vectorized ops (e.g. np.clip(q, QPOS_LEFT_MIN, QPOS_LEFT_MAX, out=q))
+DEFAULT_QPOS_LEFT = np.ascontiguousarray(DEFAULT_HAND_POSE["unitree_g1"]["left"]["open"], dtype=np.float32)
+DEFAULT_QPOS_RIGHT = np.ascontiguousarray(DEFAULT_HAND_POSE["unitree_g1"]["right"]["open"], dtype=np.float32)
 
 # thumb, middle, index
-QPOS_LEFT_MAX = [1.0472, 1.0472, 1.74533,  0, 0, 0, 0]
-QPOS_LEFT_MIN  = [-1.0472, -0.724312, 0, -1.5708, -1.74533, -1.5708, -1.74533]
-QPOS_RIGHT_MAX = [1.0472, 0.724312, 0, 1.5708, 1.74533, 1.5708, 1.74533]
-QPOS_RIGHT_MIN = [-1.0472, -1.0472, -1.74533, 0, 0, 0, 0]
+QPOS_LEFT_MAX = np.array([1.0472, 1.0472, 1.74533,  0, 0, 0, 0], dtype=np.float32)
+QPOS_LEFT_MIN  = np.array([-1.0472, -0.724312, 0, -1.5708, -1.74533, -1.5708, -1.74533], dtype=np.float32)
+QPOS_RIGHT_MAX = np.array([1.0472, 0.724312, 0, 1.5708, 1.74533, 1.5708, 1.74533], dtype=np.float32)
+QPOS_RIGHT_MIN = np.array([-1.0472, -1.0472, -1.74533, 0, 0, 0, 0], dtype=np.float32)
+QPOS_LEFT_RANGE = QPOS_LEFT_MAX - QPOS_LEFT_MIN
+QPOS_RIGHT_RANGE = QPOS_RIGHT_MAX - QPOS_RIGHT_MIN
 
 
 class Dex3_1_Controller:
@@ -64,13 +68,17 @@ class Dex3_1_Controller:
         print(f"✅ {self.left_hand.get_hand_name()} initialized")
         print(f"✅ {self.right_hand.get_hand_name()} initialized")
 
-        # Arrays for additional hand states
-        self.Ltemp = np.zeros((Dex3_Num_Motors, 2))
-        self.Rtemp = np.zeros((Dex3_Num_Motors,2))
-        self.Ltau = np.zeros(Dex3_Num_Motors)
-        self.Rtau = np.zeros(Dex3_Num_Motors)
-        self.Lpos = np.zeros(Dex3_Num_Motors)
-        self.Rpos = np.zeros(Dex3_Num_Motors)
+        # Commands are reused for every write, only q_target changes
+        self.left_cmd = self.left_hand.create_zero_command()
+        self.right_cmd = self.right_hand.create_zero_command()
+
+        # Additional hand states, one contiguous buffer per hand.
+        # Columns: q, tau, temperature (2 values per motor)
+        self.Lstate = np.zeros((Dex3_Num_Motors, 4))
+        self.Rstate = np.zeros((Dex3_Num_Motors, 4))
+        # Views into the per-hand buffers
+        self.Lpos, self.Ltau, self.Ltemp = self.Lstate[:, 0], self.Lstate[:, 1], self.Lstate[:, 2:4]
+        self.Rpos, self.Rtau, self.Rtemp = self.Rstate[:, 0], self.Rstate[:, 1], self.Rstate[:, 2:4]
 
         # Arrays for hand states
         self.left_hand_state_array  = np.zeros(Dex3_Num_Motors)
@@ -87,40 +95,36 @@ class Dex3_1_Controller:
         right_state = self.right_hand.read_hand_state()
         
         # Update arrays from new API
-        for idx in range(Dex3_Num_Motors):
-            self.left_hand_state_array[idx] = left_state.motor.q[idx]
-            self.right_hand_state_array[idx] = right_state.motor.q[idx]
-            
-            # Temperature data (2 values per motor in new API)
-            self.Ltemp[idx, 0] = left_state.motor.temperature[idx][0]
-            self.Ltemp[idx, 1] = left_state.motor.temperature[idx][1]
-            self.Rtemp[idx, 0] = right_state.motor.temperature[idx][0]
-            self.Rtemp[idx, 1] = right_state.motor.temperature[idx][1]
-            
-            # Torque and position
-            self.Ltau[idx] = left_state.motor.tau_est[idx]
-            self.Rtau[idx] = right_state.motor.tau_est[idx]
-            self.Lpos[idx] = left_state.motor.q[idx]
-            self.Rpos[idx] = right_state.motor.q[idx]
-            
+        self._read_motor_state(left_state.motor, self.Lstate)
+        self._read_motor_state(right_state.motor, self.Rstate)
+        self.left_hand_state_array[:] = self.Lpos
+        self.right_hand_state_array[:] = self.Rpos
+
         return self.left_hand_state_array.copy(), self.right_hand_state_array.copy()
 
+    @staticmethod
+    def _read_motor_state(motor, state):
+        """Copy q, tau_est and temperature (2 values per motor) of one hand into its state buffer."""
+        # Slice assignment converts the pybind sequences straight into the preallocated
+        # buffer in C, without materializing intermediate arrays
+        state[:, 0] = motor.q[:Dex3_Num_Motors]
+        state[:, 1] = motor.tau_est[:Dex3_Num_Motors]
+        state[:, 2:4] = motor.temperature[:Dex3_Num_Motors]
+
     def get_hand_all_state(self):
-        return self.Lpos.copy(), self.Rpos.copy(), self.Ltemp.copy(), self.Rtemp.copy(), self.Ltau.copy(), self.Rtau.copy()
+        # One copy per hand, the returned arrays are views into those copies
+        lstate, rstate = self.Lstate.copy(), self.Rstate.copy()
+        return lstate[:, 0], rstate[:, 0], lstate[:, 2:4], rstate[:, 2:4], lstate[:, 1], rstate[:, 1]
 
     def ctrl_dual_hand(self, left_q_target, right_q_target):
         """set current left, right hand motor state target q"""
-        # Use new unified API
-        left_cmd = self.left_hand.create_zero_command()
-        right_cmd = self.right_hand.create_zero_command()
-        
-        # Set target positions
-        left_cmd.q_target = list(left_q_target)
-        right_cmd.q_target = list(right_q_target)
+        # Set target positions (one C-level array -> list conversion per hand)
+        self.left_cmd.q_target = np.asarray(left_q_target, dtype=np.float64).tolist()
+        self.right_cmd.q_target = np.asarray(right_q_target, dtype=np.float64).tolist()
         
         # Send commands
-        self.left_hand.write_hand_command(left_cmd)
-        self.right_hand.write_hand_command(right_cmd)
+        self.left_hand.write_hand_command(self.left_cmd)
+        self.right_hand.write_hand_command(self.right_cmd)
     
     def initialize(self):
         # Use new unified API - send default poses
@@ -12,22 +12,108 @@ The data includes:
 """
 
 import argparse
-import json
+import multiprocessing
 import os
 import threading
 import time
 from datetime import datetime
-from multiprocessing import Array, Lock, shared_memory
+from multiprocessing import Array, Lock
 
 import cv2
-import numpy as np
 import redis
 from data_utils.episode_writer import EpisodeWriter
+from data_utils.json_utils import json_loads
+from data_utils.redis_watcher import RedisKeyWatcher
+from data_utils.shm_ring import ShmFrameRing
 from data_utils.vision_client import VisionClient
 from rich import print
 from robot_control.speaker import Speaker
 
 
+# Fixed layout of the recorded state/action streams: Redis key -> data_dict key
+REDIS_KEYS = (
+    "state_body_unitree_g1_with_hands",
+    "state_hand_left_unitree_g1_with_hands",
+    "state_hand_right_unitree_g1_with_hands",
+    "state_neck_unitree_g1_with_hands",
+    "t_state",
+
+    "action_body_unitree_g1_with_hands",
+    "action_hand_left_unitree_g1_with_hands",
+    "action_hand_right_unitree_g1_with_hands",
+    "action_neck_unitree_g1_with_hands",
+    "t_action",
+)
+
+DATA_DICT_KEYS = (
+    "state_body",
+    "state_hand_left",
+    "state_hand_right",
+    "state_neck",
+    "t_state",
+
+    "action_body",
+    "action_hand_left",
+    "action_hand_right",
+    "action_neck",
+    "t_action",
+)
+
+
+REDIS_TO_DATA_DICT_KEY = dict(zip(REDIS_KEYS, DATA_DICT_KEYS))
+
+
+def store_redis_results(redis_keys, redis_results, data_dict):
+    """Store the raw Redis payloads of redis_keys in data_dict, EpisodeWriter decodes them off the loop."""
+    for redis_key, result in zip(redis_keys, redis_results):
+        if result is None:
+            print(f"Warning: No data found for key {redis_key}")
+        data_dict[REDIS_TO_DATA_DICT_KEY[redis_key]] = result
+
+
+def display_process(image_ring_name, image_shape, num_slots, frequency, recording_event, stop_event):
+    """Show the latest camera frame in an OpenCV window, off the recording loop."""
+    image_ring = ShmFrameRing(image_shape, num_slots, name=image_ring_name)
+    window_name = "Press controller button to start/stop recording"
+    display_dt = 1 / frequency
+
+    # Create window with size matching image once, only frames are pushed per tick
+    cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
+    cv2.resizeWindow(window_name, image_shape[1], image_shape[0])
+    cv2.moveWindow(window_name, 50, 50)  # Position window on left side
+
+    was_recording = None
+
+    def show(image_array):
+        nonlocal was_recording
+        # Show the recording state in the title instead of drawing on the shared frame
+        recording = recording_event.is_set()
+        if recording != was_recording:
+            cv2.setWindowTitle(window_name, f"[REC] {window_name}" if recording else window_name)
+            was_recording = recording
+        cv2.imshow(window_name, image_array)
+        cv2.waitKey(1)
+
+    image_array = None
+    last_shown_seq = -1
+    try:
+        while not stop_event.is_set():
+            frame_seq, image_array = image_ring.latest()
+            # Only redraw when the vision thread published a new frame since the last draw
+            if frame_seq != last_shown_seq and image_array is not None and image_array.size > 0:
+                show(image_array)
+                last_shown_seq = frame_seq
+            else:
+                cv2.waitKey(1)  # keep the window responsive
+            time.sleep(display_dt)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        image_array = None
+        image_ring.close()
+        cv2.destroyAllWindows()
+
+
 def main(args):
 
     # Connect to Redis with connection pool for better performance
@@ -36,26 +122,36 @@ def main(args):
             host="localhost", 
             port=6379, 
             db=0,
-            max_connections=10,
+            # one connection for the record loop, one held by the keyspace-notification pubsub
+            max_connections=2,
             retry_on_timeout=True,
             socket_timeout=0.1,
-            socket_connect_timeout=0.1
+            socket_connect_timeout=0.1,
+            # redis-py already sets TCP_NODELAY on every connection; keepalive detects dead peers
+            socket_keepalive=True,
         )
         redis_client = redis.Redis(connection_pool=redis_pool)
-        redis_pipeline = redis_client.pipeline()
-        # Test connection
+        # Test connection (also opens and warms the record loop's connection)
         redis_client.ping()
         print(f"Connected to Redis at localhost:6379, DB=0 with connection pool")
     except Exception as e:
         print(f"Error connecting to Redis: {e}")
         return
 
+    # Only re-read the state/action keys that producers rewrote since the last tick
+    key_watcher = RedisKeyWatcher(redis_client, REDIS_KEYS)
+    # One frame dict reused every tick; the state/action values it holds are the latest
+    # payloads read, and the recorder keeps its own copy of each item
+    data_dict = dict.fromkeys(("idx", "rgb", "t_img") + DATA_DICT_KEYS)
+
     # Initialize OpenCV window
-    # Create shared memory for single camera - 640x480 image
+    # Create a shared memory frame ring for the stereo camera - 2 x 640x360 images side by side.
+    # The vision thread publishes into it and the recorder hands frame seqs to the writer, so
+    # frames are encoded straight from shared memory without a per-tick copy (the writer falls
+    # back to copying frames while it lags half a ring behind).
     num_cameras = 2
     image_shape = (360, 640*num_cameras, 3)  # Height, Width, Channels for OpenCV format
-    image_shared_memory = shared_memory.SharedMemory(create=True, size=int(np.prod(image_shape) * np.uint8().itemsize * num_cameras))
-    image_array = np.ndarray(image_shape, dtype=np.uint8, buffer=image_shared_memory.buf)
+    image_ring = ShmFrameRing(image_shape, num_slots=args.image_ring_slots)
 
 
     # Display settings for single camera
@@ -65,7 +161,8 @@ def main(args):
         server_address=args.robot_ip,  # robot IP
         port=5555,
         img_shape=image_shape,
-        img_shm_name=image_shared_memory.name,
+        img_shm_name=image_ring.name,
+        img_ring_slots=image_ring.num_slots,
         image_show=False,
         depth_show=False,
         unit_test=True
@@ -73,6 +170,20 @@ def main(args):
     vision_thread = threading.Thread(target=vision_client.receive_process, daemon=True)
     vision_thread.daemon = True
     vision_thread.start()
+
+    # The OpenCV window lives in its own process so GUI work never delays the recording loop
+    mp_context = multiprocessing.get_context("spawn")
+    recording_event = mp_context.Event()
+    display_stop_event = mp_context.Event()
+    display_proc = None
+    if image_show:
+        display_proc = mp_context.Process(
+            target=display_process,
+            args=(image_ring.name, image_shape, image_ring.num_slots, args.frequency,
+                  recording_event, display_stop_event),
+            daemon=True,
+        )
+        display_proc.start()
     
     # create recorder
     recording = False
@@ -80,12 +191,14 @@ def main(args):
     task_dir = os.path.join(args.data_folder, args.task_name)
     recorder = EpisodeWriter(task_dir = task_dir, frequency = args.frequency,
                              image_shape=image_shape,
-                             data_keys=save_data_keys)
+                             data_keys=save_data_keys,
+                             image_ring=image_ring,
+                             json_keys=DATA_DICT_KEYS)
     recorder.text_desc(goal="walk ahead and pick a box.",
                        desc="a humanoid robot walk head and pick a box from the table.",
                        steps="step1: walk ahead 1 meter. step2: pick a box from the table.")
     
-    control_dt = 1 / args.frequency
+    control_dt_ns = int(1e9 / args.frequency)
     step_count = 0
     running = True
     
@@ -98,12 +211,20 @@ def main(args):
     prev_button_pressed = False
     
     try:
+        next_tick_ns = time.perf_counter_ns()
         while running:
 
-            start_time = time.time()
+            # Sleep until the absolute deadline of this tick so the cadence does not drift
+            sleep_ns = next_tick_ns - time.perf_counter_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns * 1e-9)
+            elif sleep_ns < -control_dt_ns:
+                # Fell behind by more than a tick (e.g. blocking speech): resync instead of bursting
+                next_tick_ns = time.perf_counter_ns()
+            next_tick_ns += control_dt_ns
             
             # handle controller input
-            controller_data = json.loads(redis_client.get(f"controller_data"))
+            controller_data = json_loads(redis_client.get(f"controller_data"))
             button_pressed = controller_data['LeftController']['key_two']
             # print(f"==> button_pressed: {button_pressed}", end="\r")
             
@@ -119,12 +240,15 @@ def main(args):
                 print("button pressed")
                 recording = not recording
                 if recording:
+                    recording_event.set()
                     speaker.speak("episode recording started.")
                     if not recorder.create_episode():
                         recording = False
+                        recording_event.clear()
                     step_count = 0
                     print("episode recording started...")
                 else:
+                    recording_event.clear()
                     recorder.save_episode()
                     speaker.speak("episode saved.")
             
@@ -134,101 +258,31 @@ def main(args):
            
             if recording:
                 # Attempt to retrieve "action_mimic" from Redis
-                data_dict = {'idx': step_count}
-                # receive vision data
-                data_dict["rgb"] = image_array.copy()  # type: ignore
-                data_dict["t_img"] = int(time.time() * 1000) # current timestamp in ms
-
-                # Pipeline Redis operations for better performance
-                redis_keys = [
-                    "state_body_unitree_g1_with_hands",
-                    "state_hand_left_unitree_g1_with_hands",
-                    "state_hand_right_unitree_g1_with_hands",
-                    "state_neck_unitree_g1_with_hands",
-                    "t_state",
-
-                    "action_body_unitree_g1_with_hands",
-                    "action_hand_left_unitree_g1_with_hands", 
-                    "action_hand_right_unitree_g1_with_hands",
-                    "action_neck_unitree_g1_with_hands",
-                    "t_action",
-                ]
-                
-                data_dict_keys = [
-                    "state_body", 
-                    "state_hand_left",
-                    "state_hand_right",
-                    "state_neck",
-                    "t_state",
-
-                    "action_body",
-                    "action_hand_left",
-                    "action_hand_right", 
-                    "action_neck",
-                    "t_action",
-                ]
-                
+                data_dict["idx"] = step_count
+                # receive vision data: pass the ring seq, the writer encodes from the slot
+                frame_seq = image_ring.head - 1
+                data_dict["rgb"] = frame_seq if frame_seq >= 0 else None
+                data_dict["t_img"] = time.time_ns() // 1_000_000 # current timestamp in ms
+
+                changed_keys = key_watcher.pop_changed()
                 try:
-                    # Use Redis pipeline to batch all GET operations (1 network round-trip instead of 10)
-                    for key in redis_keys:
-                        redis_pipeline.get(key)
-                    redis_results = redis_pipeline.execute()
-                    
-                    # Process results with error handling
-                    for i, (result, dict_key) in enumerate(zip(redis_results, data_dict_keys)):
-                        if result is not None:
-                            try:
-                                data_dict[dict_key] = json.loads(result)
-                            except json.JSONDecodeError:
-                                print(f"Warning: Failed to decode JSON for key {redis_keys[i]}")
-                                data_dict[dict_key] = None
-                        else:
-                            print(f"Warning: No data found for key {redis_keys[i]}")
-                            data_dict[dict_key] = None
+                    if changed_keys:
+                        # A single MGET fetches all changed keys in one command and one round-trip
+                        redis_results = redis_client.mget(changed_keys)
+
+                        # Keep the raw payloads; JSON decoding happens on the writer thread
+                        store_redis_results(changed_keys, redis_results, data_dict)
                             
                 except Exception as e:
-                    print(f"Error in Redis pipeline operation: {e}")
+                    print(f"Error in Redis MGET operation: {e}")
+                    key_watcher.mark_changed(changed_keys)
                     # Fallback: skip this recording cycle
                     continue
-                
+
                 # write data to recorder
                 recorder.add_item(data_dict)
                 
-                if image_show:
-                    # Check if image array has valid data
-                    if image_array is not None and image_array.size > 0:
-                        # resize image for display (stereo image is already concatenated)
-                        # image_display = cv2.resize(image_array, (image_array.shape[1]//2, image_array.shape[0]//2))
-                        image_display = image_array
-                        # Create window with size matching image
-                        window_name = "Press controller button to start/stop recording"
-                        cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-                        cv2.resizeWindow(window_name, image_display.shape[1], image_display.shape[0])
-                        cv2.moveWindow(window_name, 50, 50)  # Position window on left side
-                        cv2.imshow(window_name, image_display)
-                        cv2.waitKey(1)
-                
                 step_count += 1
-                elapsed = time.time() - start_time
-                if elapsed < control_dt:
-                    time.sleep(control_dt - elapsed)
-            else:
-                if image_show:
-                    # Check if image array has valid data
-                    if image_array is not None and image_array.size > 0:
-                        # resize stereo image for display
-                        # image_display = cv2.resize(image_array, (image_array.shape[1]//2, image_array.shape[0]//2))
-                        image_display = image_array
-                        # Create window with size matching image
-                        window_name = "Press controller button to start/stop recording"
-                        cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-                        cv2.resizeWindow(window_name, image_display.shape[1], image_display.shape[0])
-                        cv2.moveWindow(window_name, 50, 50)  # Position window on left side
-                        cv2.imshow(window_name, image_display)
-                        cv2.waitKey(1)
-                else:
-                    # For keyboard mode, just sleep to avoid busy waiting
-                    time.sleep(0.1)
                     
     except KeyboardInterrupt:
         print("\nReceived Ctrl+C, exiting...")
@@ -236,12 +290,16 @@ def main(args):
     finally:
         print(f"\nDone! Recorded {recorder.episode_id + 1} episodes to {task_dir}")
 
-        # unlink and release shared memory
-        image_shared_memory.unlink()
-        image_shared_memory.close()
         recorder.close()
-        
-        cv2.destroyAllWindows()  # Close OpenCV window
+        key_watcher.close()
+
+        # Close OpenCV window
+        display_stop_event.set()
+        if display_proc is not None:
+            display_proc.join(timeout=2)
+
+        # unlink and release shared memory
+        image_ring.close()
         
         print("Exiting the recording...")
 
@@ -254,6 +312,8 @@ if __name__ == "__main__":
     parser.add_argument("--frequency", default=30, type=int)
     parser.add_argument("--robot", default="unitree_g1", choices=["unitree_g1"], help="robot name")
     parser.add_argument("--robot_ip", default="192.168.123.164", help="robot ip")
+    parser.add_argument("--image_ring_slots", default=32, type=int,
+                        help="frames kept in the shared image ring; bounds how far the writer may lag behind")
     
     args = parser.parse_args()
 
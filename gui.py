@@ -3,18 +3,71 @@
 FAR-TWIST Teleop Control Center GUI with Multiple Theme Options
 """
 
+import asyncio
+import codecs
+import collections
+import functools
+import getpass
 import os
-import queue
+import shlex
+import shutil
 import signal
 import subprocess
-import threading
-import time
 import tkinter as tk
-from tkinter import messagebox
+import types
 
 import customtkinter as ctk
 
 
+# Local panel commands run from the repository root
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Common ssh options: fail fast instead of hanging on an unreachable robot or a password prompt,
+# and notice a dead connection within ~10 s
+SSH_OPTIONS = (
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "LogLevel=ERROR",
+    "-o", "BatchMode=yes",
+    "-o", "ConnectTimeout=3",
+    "-o", "ServerAliveInterval=5",
+    "-o", "ServerAliveCountMax=2",
+)
+
+# Share one authenticated SSH connection to the robot between invocations
+SSH_CONTROL_OPTIONS = (
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+    "-o", "ControlPersist=600",
+)
+
+# Spawn short-lived helper commands with posix_spawn (vfork) instead of fork+exec, so the
+# heavy GUI process is not duplicated for every ssh call. subprocess only takes that path for
+# an executable given with a directory and close_fds=False; the latter is safe since Python's
+# own descriptors are non-inheritable (PEP 446) and children only get the pipes passed to them.
+FAST_SPAWN_KWARGS = types.MappingProxyType({"close_fds": False})
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(program):
+    """Absolute path of program (as given if not found on PATH)"""
+    return shutil.which(program) or program
+
+
+def fast_spawn_argv(argv):
+    """argv with its executable resolved, see FAST_SPAWN_KWARGS"""
+    return (resolve_executable(argv[0]), *argv[1:])
+
+
+# Every ssh invocation to the robot starts with this, built once at import
+SSH_BASE = (resolve_executable("ssh"), *SSH_OPTIONS, *SSH_CONTROL_OPTIONS)
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(size, weight="normal", family=None):
+    """Shared CTkFont per (size, weight, family), so widgets reuse font objects instead of creating one each"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
 class ThemeManager:
     """Theme management for different visual styles"""
     
@@ -33,6 +86,89 @@ class ThemeManager:
         "NERV": {"mode": "dark", "theme": "blue", "custom": True},
     }
     
+    COLOR_SCHEMES = {
+        "Dark Blue": {
+            "primary": "#1f538d",
+            "success": "#4CAF50", 
+            "danger": "#f44336",
+            "warning": "#ff9800",
+            "accent": "#81C784",
+            "emergency": "#ff1744"
+        },
+        "Blue": {
+            "primary": "#2196F3",
+            "success": "#4CAF50",
+            "danger": "#f44336", 
+            "warning": "#ff9800",
+            "accent": "#64B5F6",
+            "emergency": "#ff1744"
+        },
+        "Green": {
+            "primary": "#4CAF50",
+            "success": "#8BC34A",
+            "danger": "#f44336",
+            "warning": "#ff9800", 
+            "accent": "#81C784",
+            "emergency": "#ff1744"
+        },
+        "Cyberpunk": {
+            "primary": "#00ffff",
+            "success": "#00ff41",
+            "danger": "#ff0080",
+            "warning": "#ffff00",
+            "accent": "#ff6b00",
+            "emergency": "#ff0040"
+        },
+        "Neon": {
+            "primary": "#39ff14",
+            "success": "#00ff00", 
+            "danger": "#ff073a",
+            "warning": "#ffff00",
+            "accent": "#ff6600",
+            "emergency": "#ff0066"
+        },
+        "Professional": {
+            "primary": "#1976D2",
+            "success": "#388E3C",
+            "danger": "#D32F2F", 
+            "warning": "#F57C00",
+            "accent": "#7B1FA2",
+            "emergency": "#C62828"
+        },
+        "EVA Unit-01": {
+            "primary": "#4A148C",      # Deep purple (EVA-01 main color)
+            "success": "#00E676",      # Green (EVA-01 green)
+            "danger": "#FF1744",       # Red (warning color)
+            "warning": "#FF6D00",      # Orange (AT field)
+            "accent": "#E1BEE7",       # Light purple (accent)
+            "emergency": "#B71C1C"     # Deep red (emergency)
+        },
+        "EVA Unit-02": {
+            "primary": "#D32F2F",      # Red (EVA-02 main color)
+            "success": "#FF5722",      # Orange-red (startup)
+            "danger": "#B71C1C",       # Deep red (danger)
+            "warning": "#FF9800",      # Orange (warning)
+            "accent": "#FFCDD2",       # Light red (accent)
+            "emergency": "#4A148C"     # Purple (emergency)
+        },
+        "EVA Unit-00": {
+            "primary": "#1565C0",      # Blue (EVA-00 main color)
+            "success": "#00BCD4",      # Cyan (system normal)
+            "danger": "#F44336",       # Red (error)
+            "warning": "#FFC107",      # Yellow (warning)
+            "accent": "#BBDEFB",       # Light blue (accent)
+            "emergency": "#FF1744"     # Red (emergency)
+        },
+        "NERV": {
+            "primary": "#000000",      # Black (NERV main color)
+            "success": "#4CAF50",      # Green (system normal)
+            "danger": "#FF0000",       # Pure red (danger)
+            "warning": "#FFFF00",      # Pure yellow (warning)
+            "accent": "#FFFFFF",       # White (text)
+            "emergency": "#FF0000"     # Red (emergency)
+        }
+    }
+    
     @staticmethod
     def apply_theme(theme_name):
         """Apply selected theme"""
@@ -44,138 +180,148 @@ class ThemeManager:
         return ThemeManager.get_custom_colors(theme_name)
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_custom_colors(theme_name):
-        """Get custom color configuration"""
-        color_schemes = {
-            "Dark Blue": {
-                "primary": "#1f538d",
-                "success": "#4CAF50", 
-                "danger": "#f44336",
-                "warning": "#ff9800",
-                "accent": "#81C784",
-                "emergency": "#ff1744"
-            },
-            "Blue": {
-                "primary": "#2196F3",
-                "success": "#4CAF50",
-                "danger": "#f44336", 
-                "warning": "#ff9800",
-                "accent": "#64B5F6",
-                "emergency": "#ff1744"
-            },
-            "Green": {
-                "primary": "#4CAF50",
-                "success": "#8BC34A",
-                "danger": "#f44336",
-                "warning": "#ff9800", 
-                "accent": "#81C784",
-                "emergency": "#ff1744"
-            },
-            "Cyberpunk": {
-                "primary": "#00ffff",
-                "success": "#00ff41",
-                "danger": "#ff0080",
-                "warning": "#ffff00",
-                "accent": "#ff6b00",
-                "emergency": "#ff0040"
-            },
-            "Neon": {
-                "primary": "#39ff14",
-                "success": "#00ff00", 
-                "danger": "#ff073a",
-                "warning": "#ffff00",
-                "accent": "#ff6600",
-                "emergency": "#ff0066"
-            },
-            "Professional": {
-                "primary": "#1976D2",
-                "success": "#388E3C",
-                "danger": "#D32F2F", 
-                "warning": "#F57C00",
-                "accent": "#7B1FA2",
-                "emergency": "#C62828"
-            },
-            "EVA Unit-01": {
-                "primary": "#4A148C",      # Deep purple (EVA-01 main color)
-                "success": "#00E676",      # Green (EVA-01 green)
-                "danger": "#FF1744",       # Red (warning color)
-                "warning": "#FF6D00",      # Orange (AT field)
-                "accent": "#E1BEE7",       # Light purple (accent)
-                "emergency": "#B71C1C"     # Deep red (emergency)
-            },
-            "EVA Unit-02": {
-                "primary": "#D32F2F",      # Red (EVA-02 main color)
-                "success": "#FF5722",      # Orange-red (startup)
-                "danger": "#B71C1C",       # Deep red (danger)
-                "warning": "#FF9800",      # Orange (warning)
-                "accent": "#FFCDD2",       # Light red (accent)
-                "emergency": "#4A148C"     # Purple (emergency)
-            },
-            "EVA Unit-00": {
-                "primary": "#1565C0",      # Blue (EVA-00 main color)
-                "success": "#00BCD4",      # Cyan (system normal)
-                "danger": "#F44336",       # Red (error)
-                "warning": "#FFC107",      # Yellow (warning)
-                "accent": "#BBDEFB",       # Light blue (accent)
-                "emergency": "#FF1744"     # Red (emergency)
-            },
-            "NERV": {
-                "primary": "#000000",      # Black (NERV main color)
-                "success": "#4CAF50",      # Green (system normal)
-                "danger": "#FF0000",       # Pure red (danger)
-                "warning": "#FFFF00",      # Pure yellow (warning)
-                "accent": "#FFFFFF",       # White (text)
-                "emergency": "#FF0000"     # Red (emergency)
-            }
-        }
+        """Get custom color configuration (cached per theme, treat the result as read-only)"""
+        schemes = ThemeManager.COLOR_SCHEMES
+        colors = dict(schemes.get(theme_name, schemes["Dark Blue"]))
+        # Terminal output colors follow the theme's appearance mode
+        is_dark = ThemeManager.THEMES.get(theme_name, ThemeManager.THEMES["Dark Blue"])["mode"] == "dark"
+        colors["terminal_bg"] = "#0d1117" if is_dark else "#f6f8fa"
+        colors["terminal_fg"] = "#c9d1d9" if is_dark else "#24292f"
+        # Hover colors of the panel buttons, resolved once per theme
+        for key in ("success", "danger", "warning"):
+            colors[f"{key}_hover"] = ThemeManager.darken_color(colors[key])
+        return colors
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def darken_color(hex_color):
+        """Darken color for hover effect"""
+        value = int(hex_color.lstrip('#'), 16)
+        r, g, b = (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
+        return '#{:02x}{:02x}{:02x}'.format(int(r * 0.8), int(g * 0.8), int(b * 0.8))
+
+class PanelFrame(ctk.CTkFrame):
+    """Rounded, bordered outer frame shared by all terminal panels and their placeholders"""
+    
+    def __init__(self, parent, colors: dict, **kwargs):
+        kwargs.setdefault("corner_radius", 15)
+        kwargs.setdefault("border_width", 2)
+        kwargs.setdefault("border_color", colors["primary"])
+        super().__init__(parent, **kwargs)
+
+
+class AsyncRunner:
+    """Single asyncio event loop shared by all panels for subprocess I/O.
+    
+    The loop runs on the Tk thread, which it also drives (see TeleopControlCenter.run), so
+    coroutines can touch widgets directly and nothing has to hop between threads.
+    """
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        # Python 3.8's default child watcher starts a waitpid thread for every subprocess, i.e. one
+        # per click; with the loop on the main thread, children can be reaped on SIGCHLD instead
+        watcher = asyncio.SafeChildWatcher()
+        asyncio.set_child_watcher(watcher)
+        watcher.attach_loop(self.loop)
+    
+    def submit(self, coro):
+        """Schedule a coroutine on the loop, returns its task"""
+        return self.loop.create_task(coro)
+    
+    async def read_fd(self, fd, callback, chunk_bytes=65536):
+        """Pass whatever is readable on fd to callback(bytes) until EOF (must run on the loop)
+        
+        All panels' pipes are multiplexed on the loop's selector, no thread is needed per pipe.
+        """
+        os.set_blocking(fd, False)
+        eof = self.loop.create_future()
+        
+        def on_readable():
+            try:
+                data = os.read(fd, chunk_bytes)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                self.loop.remove_reader(fd)
+                eof.set_exception(e)
+                return
+            if data:
+                callback(data)
+            else:
+                self.loop.remove_reader(fd)
+                eof.set_result(None)
         
-        return color_schemes.get(theme_name, color_schemes["Dark Blue"])
+        self.loop.add_reader(fd, on_readable)
+        await eof
+    
+    def run(self, main):
+        """Run the loop until the main coroutine returns, then cancel whatever is still pending"""
+        try:
+            self.loop.run_until_complete(main)
+        finally:
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.close()
+
 
 class TerminalPanel:
     """Modern terminal panel with enhanced styling"""
     
-    def __init__(self, parent_frame, title: str, command: str, colors: dict, is_remote: bool = False, custom_kill_cmd: str = None):
+    FLUSH_INTERVAL_MS = 50  # buffered output is inserted into the textbox at most this often
+    MAX_OUTPUT_LINES = 5000  # older lines are dropped so redraws stay cheap
+    MAX_BUFFERED_CHUNKS = 8192  # pending output between flushes; the oldest is dropped when full
+    READ_CHUNK_BYTES = 65536
+    STATUS_DEBOUNCE_MS = 50  # status changes within this window are applied once
+    TERMINAL_FONT = ("Courier", 10)
+    
+    _STATUS_TEXTS = types.MappingProxyType({
+        "stopped": "OFFLINE",
+        "running": "ONLINE", 
+        "error": "ERROR",
+        "warning": "STARTING"
+    })
+    
+    def __init__(self, parent_frame, title: str, command: str, colors: dict, runner: AsyncRunner,
+                 is_remote: bool = False, custom_kill_cmd: str = None):
         self.title = title
         self.command = command
+        self._argv = shlex.split(command)  # parsed once, reused on every restart
+        self.runner = runner
         self.is_remote = is_remote
         self.custom_kill_cmd = custom_kill_cmd
         self.process = None
-        self.output_queue = queue.Queue()
+        self._monitor_task = None
         self.is_running = False
+        self.on_running_change = None  # optional callback(panel, is_running)
+        self._kill_pending = False  # SIGTERM sent, waiting for _finish_kill
+        self.kill_task = None  # the last _finish_kill, awaited on exit
         self.colors = colors
+        self._output_buffer = collections.deque(maxlen=self.MAX_BUFFERED_CHUNKS)
+        self._pending_status = None
+        self._status_scheduled = False
         
         # Create panel frame with gradient-like effect
-        self.frame = ctk.CTkFrame(parent_frame, corner_radius=15, border_width=2, 
-                                 border_color=colors["primary"])
+        self.frame = PanelFrame(parent_frame, colors)
         
         # Header with title and status
         self.header_frame = ctk.CTkFrame(self.frame, fg_color=colors["primary"], corner_radius=10)
         self.header_frame.pack(fill="x", padx=8, pady=(8, 4))
         
-        # Title with icon - using safe standard emojis
-        icons = {
-            "G1 Neck Control": "Target",
-            "G1 ZED Teleop": "Camera",
-            "G1 ZED Policy": "Policy",
-            "Onboard Policy": "Policy",
-            "Offline Motion": "Control",
-            "Online Teleop": "Remote",
-            "Visuomotor Policy Deploy": "Vision",
-            "Data Recording": "Record",
-            "Sim2Sim Deploy": "Sync",
-            "Sim2Real Deploy": "Launch"
-        }
-        
-        icon = icons.get(title, "System")
-        # Increased font size from 18 to 22 for better visibility
+        # Title - increased font size from 18 to 22 for better visibility
         self.title_label = ctk.CTkLabel(self.header_frame, text=title,
-                                       font=ctk.CTkFont(size=22, weight="bold"),
+                                       font=get_font(22, "bold"),
                                        text_color="white")
         self.title_label.pack(side="left", padx=12, pady=10)
         
         # Animated status indicator - using text instead of emojis
         self.status_label = ctk.CTkLabel(self.header_frame, text="OFFLINE", 
-                                        font=ctk.CTkFont(size=16, weight="bold"),
+                                        font=get_font(16, "bold"),
                                         text_color="#666666")
         self.status_label.pack(side="right", padx=12, pady=10)
         
@@ -184,224 +330,266 @@ class TerminalPanel:
         self.control_frame.pack(fill="x", padx=8, pady=4)
         
         # Modern buttons with larger size
-        self.start_btn = ctk.CTkButton(self.control_frame, text="START", 
-                                      command=self.start, width=100, height=40,
-                                      fg_color=colors["success"], 
-                                      hover_color=self._darken_color(colors["success"]),
-                                      font=ctk.CTkFont(size=14, weight="bold"))
-        self.start_btn.pack(side="left", padx=3)
-        
-        self.kill_btn = ctk.CTkButton(self.control_frame, text="KILL", 
-                                     command=self.kill, width=100, height=40,
-                                     fg_color=colors["danger"],
-                                     hover_color=self._darken_color(colors["danger"]),
-                                     font=ctk.CTkFont(size=14, weight="bold"))
-        self.kill_btn.pack(side="left", padx=3)
-        
-        self.clear_btn = ctk.CTkButton(self.control_frame, text="CLEAR", 
-                                      command=self.clear_output, width=100, height=40,
-                                      fg_color=colors["warning"],
-                                      hover_color=self._darken_color(colors["warning"]),
-                                      font=ctk.CTkFont(size=14, weight="bold"))
-        self.clear_btn.pack(side="left", padx=3)
+        self.start_btn = self._mkbtn("START", "success", self.start)
+        self.kill_btn = self._mkbtn("KILL", "danger", self.kill)
+        self.clear_btn = self._mkbtn("CLEAR", "warning", self.clear_output)
         
         # Command display with styling - increased font size from 10 to 12
         self.cmd_label = ctk.CTkLabel(self.frame, text=f"Command: {command}",
-                                     font=ctk.CTkFont(size=12),
+                                     font=get_font(12),
                                      text_color=colors["accent"])
         self.cmd_label.pack(fill="x", padx=10, pady=(0, 4))
         
-        # Enhanced terminal output - keep terminal font size
-        self.output_text = ctk.CTkTextbox(self.frame, height=100,
-                                         font=ctk.CTkFont(family="Courier", size=10),
-                                         fg_color="#0d1117" if ctk.get_appearance_mode() == "Dark" else "#f6f8fa",
-                                         text_color="#c9d1d9" if ctk.get_appearance_mode() == "Dark" else "#24292f",
-                                         border_width=1,
-                                         border_color=colors["primary"])
-        self.output_text.pack(fill="both", expand=True, padx=8, pady=(0, 8))
-        
-        # Start output reader
-        threading.Thread(target=self._output_reader, daemon=True).start()
+        # Enhanced terminal output - keep terminal font size.
+        # Plain tk.Text (no CTk canvas layers), read-only and without wrapping, since it is redrawn the most
+        output_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        output_frame.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self.output_text = tk.Text(output_frame, height=6,
+                                   font=self.TERMINAL_FONT,
+                                   bg=colors["terminal_bg"],
+                                   fg=colors["terminal_fg"],
+                                   bd=0, highlightthickness=1,
+                                   highlightbackground=colors["primary"],
+                                   highlightcolor=colors["primary"],
+                                   wrap="none", undo=False, maxundo=0,
+                                   state="disabled")
+        output_scrollbar = ctk.CTkScrollbar(output_frame, command=self.output_text.yview)
+        self.output_text.configure(yscrollcommand=output_scrollbar.set)
+        output_scrollbar.pack(side="right", fill="y")
+        self.output_text.pack(side="left", fill="both", expand=True)
+        
+        # Periodic pump that moves buffered output into the textbox
+        self.output_text.after(self.FLUSH_INTERVAL_MS, self._flush_output)
     
-    def _darken_color(self, hex_color):
-        """Darken color for hover effect"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        darkened = tuple(max(0, int(c * 0.8)) for c in rgb)
-        return '#{:02x}{:02x}{:02x}'.format(*darkened)
+    def _mkbtn(self, text: str, color: str, command):
+        """Create and pack a control button in the panel's shared style, color is a palette key"""
+        button = ctk.CTkButton(self.control_frame, text=text, command=command,
+                               width=100, height=40,
+                               fg_color=self.colors[color],
+                               hover_color=self.colors[f"{color}_hover"],
+                               font=get_font(14, "bold"))
+        button.pack(side="left", padx=3)
+        return button
     
     def _update_status(self, status: str, color: str):
-        """Update status indicator"""
-        status_texts = {
-            "stopped": "OFFLINE",
-            "running": "ONLINE", 
-            "error": "ERROR",
-            "warning": "STARTING"
-        }
-        status_text = status_texts.get(status, "OFFLINE")
+        """Update status indicator (bursts are coalesced and only the last status is shown)"""
+        self._pending_status = (self._STATUS_TEXTS.get(status, "OFFLINE"), color)
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.status_label.after(self.STATUS_DEBOUNCE_MS, self._apply_status)
+    
+    def _apply_status(self):
+        """Apply the latest requested status"""
+        self._status_scheduled = False
+        status_text, color = self._pending_status
         self.status_label.configure(text=status_text, text_color=color)
     
+    def _set_running(self, running: bool):
+        self.is_running = running
+        if self.on_running_change is not None:
+            self.on_running_change(self, running)
+    
     def _log_output(self, text: str):
-        """Add output text"""
-        self.output_queue.put(text)
+        """Add output text (buffered, the flush pump inserts it into the textbox)"""
+        self._output_buffer.append(text)
     
     def _build_ssh_command(self, remote_command: str) -> list:
         """Build SSH command"""
-        cmd = ["ssh"]
         if "sudo" in remote_command:
-            cmd.append("-t")
-        cmd.extend([
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "LogLevel=ERROR", 
-            "g1",
-            remote_command
-        ])
-        return cmd
-    
-    def _output_reader(self):
-        """Output reading thread"""
-        while True:
-            try:
-                text = self.output_queue.get(timeout=0.1)
-                self.output_text.after_idle(lambda t=text: self._insert_text(t))
-            except queue.Empty:
-                continue
+            return [*SSH_BASE, "-t", "g1", remote_command]
+        return [*SSH_BASE, "g1", remote_command]
+    
+    def _flush_output(self):
+        """Insert everything buffered since the last flush with a single insert, then reschedule"""
+        if self._output_buffer:
+            chunks = []
+            while self._output_buffer:
+                chunks.append(self._output_buffer.popleft())
+            self._insert_text("".join(chunks))
+        self.output_text.after(self.FLUSH_INTERVAL_MS, self._flush_output)
     
     def _insert_text(self, text: str):
         """Insert text into output box"""
+        self.output_text.configure(state="normal")
         self.output_text.insert("end", text)
+        num_lines = int(self.output_text.index("end-1c").split(".")[0])
+        if num_lines > self.MAX_OUTPUT_LINES:
+            self.output_text.delete("1.0", f"{num_lines - self.MAX_OUTPUT_LINES + 1}.0")
+        self.output_text.configure(state="disabled")
         self.output_text.see("end")
     
     def start(self):
         """Start process"""
+        return self.runner.submit(self.start_async())
+    
+    async def start_async(self):
+        """Start process on the shared loop; returns once it is spawned, its output is streamed by a background task.
+        
+        Returns False if the process could not be started (the reason is logged to the panel).
+        """
         if self.is_running:
             self._log_output("Process already running!\n")
-            return
+            return True
+        if self._kill_pending:
+            self._log_output("Previous process is still being stopped, try again shortly\n")
+            return False
             
         self._log_output(f"Starting: {self.command}\n")
         self._update_status("warning", self.colors["warning"])
+        self._set_running(True)
         
-        if self.is_remote:
-            self._start_remote()
-        else:
-            self._start_local()
-    
-    def _start_local(self):
-        """Start local process"""
         try:
-            cwd = os.path.dirname(os.path.abspath(__file__))
-            
-            self.process = subprocess.Popen(
-                self.command.split(),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT, 
-                universal_newlines=True,
-                cwd=cwd,
-                preexec_fn=os.setsid
-            )
-            
-            self.is_running = True
-            self._update_status("running", self.colors["success"])
-            
-            threading.Thread(target=self._monitor_output, daemon=True).start()
-            
+            self.process = self._spawn()
         except Exception as e:
-            self._log_output(f"Error: {e}\n")
+            self._log_output(f"{'Connection error' if self.is_remote else 'Error'}: {e}\n")
+            self._set_running(False)
             self._update_status("error", self.colors["danger"])
+            return False
+        
+        self._update_status("running", self.colors["success"])
+        if self.is_remote:
+            self._log_output("Connected to G1\n")
+        
+        self._monitor_task = asyncio.ensure_future(self._monitor_output(self.process))
+        return True
     
-    def _start_remote(self):
-        """Start remote process"""
-        try:
+    def _spawn(self):
+        """Start the local or remote process"""
+        if self.is_remote:
             self._log_output("Connecting to G1...\n")
-            
-            ssh_cmd = self._build_ssh_command(f"cd ~ && {self.command}")
-            
-            self.process = subprocess.Popen(
-                ssh_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                preexec_fn=os.setsid
-            )
-            
-            self.is_running = True
-            self._update_status("running", self.colors["success"])
-            self._log_output("Connected to G1\n")
-            
-            threading.Thread(target=self._monitor_output, daemon=True).start()
-            
-        except Exception as e:
-            self._log_output(f"Connection error: {e}\n")
-            self._update_status("error", self.colors["danger"])
+            argv = self._build_ssh_command(f"cd ~ && {self.command}")
+            cwd = None
+        else:
+            argv = self._argv
+            cwd = BASE_DIR
+        
+        # Plain Popen: the output is read straight from the raw pipe fd (read_fd) and the exit polled with poll()
+        return subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=cwd,
+            # New process group for killpg, without the preexec_fn fork path that is unsafe with threads;
+            # this (and cwd) rules out posix_spawn on Python 3.8, but panels are spawned once per start
+            start_new_session=True
+        )
     
-    def _monitor_output(self):
-        """Monitor process output"""
+    async def _monitor_output(self, process):
+        """Stream the process output until it exits (runs on the shared loop)"""
         try:
-            while self.process and self.process.poll() is None:
-                line = self.process.stdout.readline()
-                if line:
-                    self._log_output(line)
+            # Forward whatever is available instead of waiting for full lines (progress bars, prompts);
+            # the incremental decoder keeps multi-byte characters split across reads intact
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            await self.runner.read_fd(process.stdout.fileno(),
+                                      lambda data: self._log_output(decoder.decode(data)),
+                                      self.READ_CHUNK_BYTES)
+            process.stdout.close()
             
-            if self.process:
-                return_code = self.process.poll()
-                self._log_output(f"\nProcess finished (code: {return_code})\n")
-                
-            self.is_running = False
-            self._update_status("stopped", "#666666")
+            # Output closed; reap the process without blocking the loop
+            while process.poll() is None:
+                await asyncio.sleep(0.1)
+            self._log_output(f"\nProcess finished (code: {process.returncode})\n")
+            
+            # A killed process's output may outlive it; leave the state of a newer process alone
+            if process is self.process:
+                self._set_running(False)
+                self._update_status("stopped", "#666666")
             
         except Exception as e:
             self._log_output(f"Monitor error: {e}\n")
-            self.is_running = False
-            self._update_status("error", self.colors["danger"])
+            if process is self.process:
+                self._set_running(False)
+                self._update_status("error", self.colors["danger"])
     
     def kill(self):
-        """Kill process"""
+        """Kill process (repeated calls while a kill is pending are ignored).
+        
+        Returns the task finishing the kill, which resolves to whether it succeeded, or None if no kill was started.
+        """
         if not self.is_running:
             self._log_output("No process running!\n")
-            return
+            return None
+        if self._kill_pending:
+            return self.kill_task
+        self._kill_pending = True
             
         self._log_output("Killing process...\n")
         
         try:
-            if self.process:
-                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
-                time.sleep(1)
-                if self.process.poll() is None:
-                    os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
+            process = self.process
+            pgid = None
+            if process:
+                pgid = os.getpgid(process.pid)
+                os.killpg(pgid, signal.SIGTERM)
+            # Give the process group a second to exit without blocking the GUI
+            self.kill_task = self.runner.submit(self._finish_kill(process, pgid))
+            return self.kill_task
             
-            if self.custom_kill_cmd:
-                self._execute_cleanup_command()
-                        
-            self.is_running = False
+        except Exception as e:
+            self._kill_pending = False
+            self._log_output(f"Kill error: {e}\n")
+            return None
+    
+    async def _finish_kill(self, process, pgid, grace=1.0):
+        """SIGKILL the signalled process group if SIGTERM was not enough, then run the cleanup command"""
+        try:
+            await asyncio.sleep(grace)
+            if pgid is not None and process.poll() is None:
+                try:
+                    os.killpg(pgid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass  # the group exited meanwhile
+            
+            self._set_running(False)
             self._update_status("stopped", "#666666")
             self._log_output("Process killed\n")
             
+            if self.custom_kill_cmd:
+                # Awaited: starts are refused until the cleanup is done, so it can't hit a new process
+                self._log_output(f"Cleanup: {self.custom_kill_cmd}\n")
+                await self._run_cleanup()
+            
+            return True
+            
         except Exception as e:
             self._log_output(f"Kill error: {e}\n")
+            return False
+        finally:
+            self._kill_pending = False
     
-    def _execute_cleanup_command(self):
-        """Execute cleanup command"""
-        self._log_output(f"Cleanup: {self.custom_kill_cmd}\n")
-        
+    async def _run_cleanup(self, timeout=10):
+        """Run the cleanup command on the shared loop"""
         try:
             if self.is_remote:
                 cleanup_cmd = self._build_ssh_command(self.custom_kill_cmd)
             else:
                 cleanup_cmd = self.custom_kill_cmd.split()
             
-            result = subprocess.run(cleanup_cmd, capture_output=True, text=True, timeout=10)
+            proc = await asyncio.create_subprocess_exec(
+                *fast_spawn_argv(cleanup_cmd), stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+                **FAST_SPAWN_KWARGS
+            )
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                self._log_output(f"Cleanup error: timed out after {timeout}s\n")
+                return
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self._log_output("Cleanup successful\n")
             else:
-                self._log_output(f"Cleanup failed (code: {result.returncode})\n")
+                self._log_output(f"Cleanup failed (code: {returncode})\n")
                     
         except Exception as e:
             self._log_output(f"Cleanup error: {e}\n")
     
     def clear_output(self):
         """Clear output"""
+        self.output_text.configure(state="normal")
         self.output_text.delete("1.0", "end")
+        self.output_text.configure(state="disabled")
         self._log_output("Output cleared\n")
 
 
@@ -414,6 +602,13 @@ class TeleopControlCenter:
         # self.current_theme = "NERV"
         self.colors = ThemeManager.apply_theme(self.current_theme)
         
+        # Shared event loop for all panel subprocesses
+        self.runner = AsyncRunner()
+        # Panels with a live process, kept up to date by the panels themselves
+        self._running_panels = set()
+        # Last known G1 connection state, written by both the watchdog and "Test SSH"
+        self._g1_connected = None
+        
         self.root = ctk.CTk()
         self.root.title("FAR-TWIST Teleop Control Center")
         self.root.geometry("1800x1100")
@@ -423,8 +618,17 @@ class TeleopControlCenter:
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_columnconfigure(1, weight=2)
         
+        # Closing the window only ends the Tk loop, see _main
+        self._quit_requested = False
+        self.root.protocol("WM_DELETE_WINDOW", self._request_quit)
+        
+        # Build hidden and map the finished window once, instead of laying out after every widget
+        self.root.withdraw()
         self._create_widgets()
-        self._test_g1_connection()
+        self.root.deiconify()
+        # Open the shared SSH master connection in the background (later ssh calls skip the handshake)
+        # and keep the G1 status label in sync with it
+        self.runner.submit(self._g1_watchdog())
     
     def _create_widgets(self):
         """Create interface components"""
@@ -455,7 +659,7 @@ class TeleopControlCenter:
         
         # Title - increased font size from 28 to 32
         title_label = ctk.CTkLabel(header_frame, text=title_text,
-                                  font=ctk.CTkFont(size=32, weight="bold"),
+                                  font=get_font(32, "bold"),
                                   text_color="white")
         title_label.pack(side="left", padx=30, pady=20)
         
@@ -465,7 +669,7 @@ class TeleopControlCenter:
         
         # Increased font size from 14 to 16
         theme_label = ctk.CTkLabel(theme_frame, text="Theme:",
-                                  font=ctk.CTkFont(size=16, weight="bold"),
+                                  font=get_font(16, "bold"),
                                   text_color="white")
         theme_label.pack(side="left", padx=(0, 10))
         
@@ -473,7 +677,7 @@ class TeleopControlCenter:
                                                values=list(ThemeManager.THEMES.keys()),
                                                command=self._change_theme,
                                                width=160, height=35,
-                                               font=ctk.CTkFont(size=14, weight="bold"))
+                                               font=get_font(14, "bold"))
         self.theme_selector.set(self.current_theme)
         self.theme_selector.pack(side="left")
         
@@ -484,7 +688,7 @@ class TeleopControlCenter:
         # Disable firewall button
         firewall_btn = ctk.CTkButton(control_buttons_frame, text="🔥 Disable Firewall",
                                     command=self._disable_firewall,
-                                    font=ctk.CTkFont(size=14, weight="bold"),
+                                    font=get_font(14, "bold"),
                                     fg_color="#FF9800",
                                     hover_color="#E68900",
                                     width=180, height=45)
@@ -493,7 +697,7 @@ class TeleopControlCenter:
         # Emergency stop button - increased font size
         emergency_btn = ctk.CTkButton(control_buttons_frame, text="🚨 EMERGENCY STOP",
                                      command=self._emergency_stop,
-                                     font=ctk.CTkFont(size=18, weight="bold"),
+                                     font=get_font(18, "bold"),
                                      fg_color=self.colors["emergency"],
                                      hover_color="#b71c1c",
                                      width=250, height=55)
@@ -508,41 +712,38 @@ class TeleopControlCenter:
         
         # Title - increased font size from 20 to 24
         left_title = ctk.CTkLabel(left_frame, text="Remote G1 Robot (SSH)",
-                                 font=ctk.CTkFont(size=24, weight="bold"))
+                                 font=get_font(24, "bold"))
         left_title.grid(row=0, column=0, padx=20, pady=20)
         
         # Panel container
         panels_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
         panels_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
-        panels_frame.grid_rowconfigure(0, weight=1)
-        panels_frame.grid_rowconfigure(1, weight=1)
-        panels_frame.grid_rowconfigure(2, weight=1)
-        panels_frame.grid_rowconfigure(3, weight=1)
+        panels_frame.grid_rowconfigure((0, 1, 2, 3), weight=1)
         panels_frame.grid_columnconfigure(0, weight=1)
         
         # G1 server panels
         self.neck_panel = TerminalPanel(panels_frame, "G1 Neck Control",
                                        "bash ~/g1-onboard/docker_neck.sh", 
-                                       self.colors, is_remote=True,
+                                       self.colors, self.runner, is_remote=True,
                                        custom_kill_cmd="pkill -f neck_teleop.py")
         self.neck_panel.frame.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
         
         self.zed_panel = TerminalPanel(panels_frame, "G1 ZED Teleop",
                                       "bash ~/g1-onboard/docker_zed.sh",
-                                      self.colors, is_remote=True,
+                                      self.colors, self.runner, is_remote=True,
                                       custom_kill_cmd="pkill -9 OrinVideoSender")
         self.zed_panel.frame.grid(row=1, column=0, sticky="nsew", pady=(5, 5))
         
         # New ZED Policy panel
         self.zed_policy_panel = TerminalPanel(panels_frame, "G1 ZED Policy",
                                              "bash ~/g1-onboard/docker_zed_policy.sh",
-                                             self.colors, is_remote=True)
+                                             self.colors, self.runner, is_remote=True)
         self.zed_policy_panel.frame.grid(row=2, column=0, sticky="nsew", pady=(5, 0))
         
         # Onboard Policy panel
         # self.onboard_policy_panel = TerminalPanel(panels_frame, "Onboard Policy",
         #                                          "bash ~/g1-onboard/sim2real.sh",
-        #                                          self.colors, is_remote=True)
+        #                                          self.colors, self.runner, is_remote=True)
         # self.onboard_policy_panel.frame.grid(row=3, column=0, sticky="nsew", pady=(5, 0))
         
         # All control buttons in one row
@@ -551,7 +752,7 @@ class TeleopControlCenter:
         
         kill_port_btn = ctk.CTkButton(buttons_frame, text="Kill Port",
                                      command=self._execute_kill_port,
-                                     font=ctk.CTkFont(size=12, weight="bold"),
+                                     font=get_font(12, "bold"),
                                      fg_color=self.colors["danger"],
                                      hover_color="#b71c1c",
                                      width=100, height=40)
@@ -559,7 +760,7 @@ class TeleopControlCenter:
         
         test_zed_btn = ctk.CTkButton(buttons_frame, text="Test ZED",
                                     command=self._execute_test_zed,
-                                    font=ctk.CTkFont(size=12, weight="bold"),
+                                    font=get_font(12, "bold"),
                                     fg_color=self.colors["primary"],
                                     hover_color="#1f4e8b",
                                     width=100, height=40)
@@ -567,7 +768,7 @@ class TeleopControlCenter:
         
         g1_startup_btn = ctk.CTkButton(buttons_frame, text="🚀 Start Neck & ZED Teleop",
                                       command=self._start_g1_servers,
-                                      font=ctk.CTkFont(size=12, weight="bold"),
+                                      font=get_font(12, "bold"),
                                       fg_color="#FF6B00",
                                       hover_color="#E55A00",
                                       width=180, height=40)
@@ -583,13 +784,13 @@ class TeleopControlCenter:
         
         # Increased font size from 16 to 18
         status_title = ctk.CTkLabel(status_frame, text="Connection Status",
-                                   font=ctk.CTkFont(size=18, weight="bold"),
+                                   font=get_font(18, "bold"),
                                    text_color="white")
         status_title.pack(side="left", padx=20, pady=15)
         
         # Increased font size from 14 to 16
         self.g1_status_label = ctk.CTkLabel(status_frame, text="G1 OFFLINE",
-                                           font=ctk.CTkFont(size=16, weight="bold"),
+                                           font=get_font(16, "bold"),
                                            text_color="white")
         self.g1_status_label.pack(side="left", padx=20)
         
@@ -598,7 +799,7 @@ class TeleopControlCenter:
                                 width=130, height=40,
                                 fg_color="white", text_color=self.colors["primary"],
                                 hover_color="#f0f0f0",
-                                font=ctk.CTkFont(size=14, weight="bold"))
+                                font=get_font(14, "bold"))
         test_btn.pack(side="right", padx=20, pady=10)
     
     def _create_right_panel(self):
@@ -606,13 +807,11 @@ class TeleopControlCenter:
         right_frame = ctk.CTkFrame(self.root, corner_radius=20)
         right_frame.grid(row=1, column=1, sticky="nsew", padx=(10, 20), pady=20)
         right_frame.grid_rowconfigure(1, weight=1)
-        right_frame.grid_columnconfigure(0, weight=1)
-        right_frame.grid_columnconfigure(1, weight=1)
-        right_frame.grid_columnconfigure(2, weight=1)
+        right_frame.grid_columnconfigure((0, 1, 2), weight=1)
         
         # Title - increased font size from 20 to 24
         right_title = ctk.CTkLabel(right_frame, text="Local Servers",
-                                  font=ctk.CTkFont(size=24, weight="bold"))
+                                  font=get_font(24, "bold"))
         right_title.grid(row=0, column=0, columnspan=3, padx=20, pady=20)
         
         # Server panels
@@ -632,7 +831,7 @@ class TeleopControlCenter:
             title_frame.grid(row=1, column=i, sticky="ew", padx=10, pady=(0, 10))
             
             title_label = ctk.CTkLabel(title_frame, text=title,
-                                      font=ctk.CTkFont(size=24, weight="bold"),
+                                      font=get_font(24, "bold"),
                                       text_color="white")
             title_label.pack(pady=15)
         
@@ -640,45 +839,41 @@ class TeleopControlCenter:
         servers_frame = ctk.CTkFrame(parent, fg_color="transparent")
         servers_frame.grid(row=2, column=0, columnspan=3, sticky="nsew", padx=20, pady=(0, 20))
         servers_frame.grid_rowconfigure(0, weight=1)
-        servers_frame.grid_columnconfigure(0, weight=1)
-        servers_frame.grid_columnconfigure(1, weight=1)
-        servers_frame.grid_columnconfigure(2, weight=1)
+        servers_frame.grid_columnconfigure((0, 1, 2), weight=1)
         
         # Low level servers
         low_frame = ctk.CTkFrame(servers_frame, fg_color="transparent")
         low_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 7))
-        low_frame.grid_rowconfigure(0, weight=1)
-        low_frame.grid_rowconfigure(1, weight=1)
+        low_frame.grid_rowconfigure((0, 1), weight=1)
         low_frame.grid_columnconfigure(0, weight=1)
         
-        self.sim2sim_panel = TerminalPanel(low_frame, "Sim2Sim Deploy",
-                                          "bash sim2sim.sh", self.colors)
-        self.sim2sim_panel.frame.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
+        # Rarely used, built on first load
+        self._create_lazy_panel(low_frame, "sim2sim_panel", "Sim2Sim Deploy", "bash sim2sim.sh",
+                                row=0, column=0, sticky="nsew", pady=(0, 5))
         
         self.sim2real_panel = TerminalPanel(low_frame, "Sim2Real Deploy", 
-                                           "bash sim2real.sh", self.colors,
+                                           "bash sim2real.sh", self.colors, self.runner,
                                            custom_kill_cmd="pkill -f server_low_level_g1_real_future.py")
         self.sim2real_panel.frame.grid(row=1, column=0, sticky="nsew", pady=(5, 0))
         
         # High level servers
         high_frame = ctk.CTkFrame(servers_frame, fg_color="transparent")
         high_frame.grid(row=0, column=1, sticky="nsew", padx=7)
-        high_frame.grid_rowconfigure(0, weight=1)
-        high_frame.grid_rowconfigure(1, weight=1)
-        high_frame.grid_rowconfigure(2, weight=1)
+        high_frame.grid_rowconfigure((0, 1, 2), weight=1)
         high_frame.grid_columnconfigure(0, weight=1)
         
         self.motion_panel = TerminalPanel(high_frame, "Offline Motion",
-                                         "bash run_motion_server.sh", self.colors)
+                                         "bash run_motion_server.sh", self.colors, self.runner)
         self.motion_panel.frame.grid(row=0, column=0, sticky="nsew", pady=(0, 3))
         
         self.teleop_panel = TerminalPanel(high_frame, "Online Teleop",
-                                         "bash teleop.sh", self.colors)
+                                         "bash teleop.sh", self.colors, self.runner)
         self.teleop_panel.frame.grid(row=1, column=0, sticky="nsew", pady=(3, 3))
         
-        self.visuomotor_panel = TerminalPanel(high_frame, "Visuomotor Policy Deploy",
-                                             "bash /home/ANT.AMAZON.COM/yanjieze/lab42/src/Improved-3D-Diffusion-Policy/deploy_policy.sh", self.colors)
-        self.visuomotor_panel.frame.grid(row=2, column=0, sticky="nsew", pady=(3, 0))
+        # Rarely used, built on first load
+        self._create_lazy_panel(high_frame, "visuomotor_panel", "Visuomotor Policy Deploy",
+                                "bash /home/ANT.AMAZON.COM/yanjieze/lab42/src/Improved-3D-Diffusion-Policy/deploy_policy.sh",
+                                row=2, column=0, sticky="nsew", pady=(3, 0))
         
         # Record server
         record_frame = ctk.CTkFrame(servers_frame, fg_color="transparent")
@@ -687,7 +882,7 @@ class TeleopControlCenter:
         record_frame.grid_columnconfigure(0, weight=1)
         
         self.record_panel = TerminalPanel(record_frame, "Data Recording",
-                                         "bash data_record.sh", self.colors,
+                                         "bash data_record.sh", self.colors, self.runner,
                                          custom_kill_cmd="pkill -f server_data_record.py")
         self.record_panel.frame.grid(row=0, column=0, sticky="nsew")
         
@@ -697,48 +892,135 @@ class TeleopControlCenter:
         
         local_startup_btn = ctk.CTkButton(local_startup_frame, text="🚀 Start Sim2Real Deploy & Teleop & Record",
                                          command=self._start_local_servers,
-                                         font=ctk.CTkFont(size=16, weight="bold"),
+                                         font=get_font(16, "bold"),
                                          fg_color="#FF6B00",
                                          hover_color="#E55A00",
                                          width=500, height=50)
         local_startup_btn.pack(pady=15)
         
-        # Store all panels
+        # Store all panels (lazy panels are added when they are loaded)
         self.all_panels = [
             self.neck_panel, self.zed_panel, self.zed_policy_panel,
             
             #  self.onboard_policy_panel, 
             
             self.motion_panel,
-            self.teleop_panel, self.visuomotor_panel, self.record_panel, self.sim2sim_panel,
+            self.teleop_panel, self.record_panel,
             self.sim2real_panel
         ]
+        for panel in self.all_panels:
+            panel.on_running_change = self._on_panel_running_change
+    
+    def _create_lazy_panel(self, parent, attr_name, title, command, **grid_kwargs):
+        """Reserve a panel's grid slot with a load button and build the panel on first click"""
+        setattr(self, attr_name, None)
+        factory = functools.partial(TerminalPanel, parent, title, command, self.colors, self.runner)
+        placeholder = PanelFrame(parent, self.colors)
+        placeholder.grid(**grid_kwargs)
+        
+        def load():
+            placeholder.destroy()
+            panel = factory()
+            panel.frame.grid(**grid_kwargs)
+            panel.on_running_change = self._on_panel_running_change
+            setattr(self, attr_name, panel)
+            self.all_panels.append(panel)
+        
+        load_btn = ctk.CTkButton(placeholder, text=f"▶ Load {title}", command=load,
+                                 font=get_font(14, "bold"), height=40)
+        load_btn.place(relx=0.5, rely=0.5, anchor="center")
     
     def _change_theme(self, theme_name):
         """Change theme"""
         self.current_theme = theme_name
-        messagebox.showinfo("Theme Change", 
-                           f"Theme changed to {theme_name}!\nRestart the application to see the changes.")
+        self._message("Theme Change", 
+                      f"Theme changed to {theme_name}!\nRestart the application to see the changes.")
+    
+    async def _exec(self, argv, timeout):
+        """Run a command on the shared loop, return (returncode, stdout, stderr) as bytes; raises asyncio.TimeoutError"""
+        proc = await asyncio.create_subprocess_exec(
+            *fast_spawn_argv(argv),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **FAST_SPAWN_KWARGS
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, out, err
+    
+    @staticmethod
+    def _dialog_text(data: bytes, limit=4096) -> str:
+        """Decode the part of a command output shown in a dialog, a messagebox can't usefully show more"""
+        return data[:limit].decode("utf-8", "replace")
+    
+    async def _ssh(self, remote_command, timeout):
+        """Run a command on G1 over the shared SSH connection"""
+        ssh_cmd = [*SSH_BASE, "g1", remote_command]
+        return await self._exec(ssh_cmd, timeout)
     
     def _test_g1_connection(self):
         """Test G1 connection"""
-        def test_connection():
+        self.runner.submit(self._probe_g1())
+    
+    async def _probe_g1(self):
+        """Run a no-op on G1 and show the result"""
+        try:
+            returncode, _, _ = await self._ssh("true", timeout=10)
+            connected = returncode == 0
+        except Exception:
+            connected = False
+        self._update_g1_status(connected)
+    
+    async def _g1_watchdog(self, interval=5):
+        """Keep the SSH master to G1 up and the status label current.
+        
+        'ssh -O check' only asks the local master process, so a check costs no network traffic;
+        the master itself exits within ~10 s of the link dying (ServerAlive options), which is
+        then seen here as a status change and triggers a reconnect.
+        """
+        check_cmd = (*SSH_BASE, "-O", "check", "g1")
+        while True:
             try:
-                ssh_cmd = ["ssh", "-o", "StrictHostKeyChecking=no", "-o", "ConnectTimeout=5",
-                          "-o", "LogLevel=ERROR", "g1", "echo 'SSH test successful'"]
-                
-                result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=10)
-                
-                connected = result.returncode == 0
-                self.root.after(0, lambda: self._update_g1_status(connected))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self._update_g1_status(False))
-        
-        threading.Thread(target=test_connection, daemon=True).start()
+                returncode, _, _ = await self._exec(check_cmd, timeout=5)
+                if returncode != 0:
+                    await self._start_ssh_master()
+                    returncode, _, _ = await self._exec(check_cmd, timeout=5)
+                alive = returncode == 0
+            except Exception:
+                alive = False
+            self._update_g1_status(alive)
+            await asyncio.sleep(interval)
+    
+    async def _start_ssh_master(self, timeout=15):
+        """Start the SSH ControlMaster used by the panels and helpers"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *SSH_BASE, "-N", "-f", "g1",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                **FAST_SPAWN_KWARGS
+            )
+            # ssh -f returns once authenticated; ConnectTimeout doesn't cover a stalled key exchange or auth
+            try:
+                await asyncio.wait_for(proc.wait(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                print(f"Failed to start SSH master connection: timed out after {timeout}s")
+        except Exception as e:
+            print(f"Failed to start SSH master connection: {e}")
     
     def _update_g1_status(self, connected: bool):
-        """Update G1 status"""
+        """Update G1 status (the label is only reconfigured when the state changes)"""
+        if connected == self._g1_connected:
+            return
+        self._g1_connected = connected
         if connected:
             self.g1_status_label.configure(text="G1 ONLINE", text_color="#4CAF50")
         else:
@@ -746,124 +1028,197 @@ class TeleopControlCenter:
     
     def _execute_kill_port(self):
         """Execute kill_port.sh via SSH"""
-        def run_kill_port():
-            try:
-                ssh_cmd = ["ssh", "-o", "StrictHostKeyChecking=no", "-o", "LogLevel=ERROR", 
-                          "-t", "g1", "echo '123' | sudo -S bash ~/g1-onboard/kill_port.sh"]
-                
-                result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=30)
+        self.runner.submit(self._run_kill_port())
+    
+    async def _run_kill_port(self):
+        try:
+            # Non-interactive: relies on a NOPASSWD sudoers entry on G1 (see README), no password is sent
+            returncode, out, err = await self._ssh("sudo -n /usr/local/sbin/kill_port.sh", timeout=30)
+            
+            if returncode == 0:
+                self._toast("kill_port.sh executed successfully!")
+            else:
+                error_msg = self._dialog_text(err or out) or "Unknown error"
+                hint = "\n\nAllow it without a password with a sudoers entry on G1, see the README"
+                self._message("Kill Port Error", f"Failed to execute kill_port.sh:\n{error_msg}{hint}", error=True)
                 
-                if result.returncode == 0:
-                    self.root.after(0, lambda: messagebox.showinfo("Kill Port", "kill_port.sh executed successfully!"))
-                else:
-                    error_msg = result.stderr or result.stdout or "Unknown error"
-                    self.root.after(0, lambda: messagebox.showerror("Kill Port Error", f"Failed to execute kill_port.sh:\n{error_msg}"))
-                    
-            except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: messagebox.showerror("Kill Port Error", "Command timed out"))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Kill Port Error", f"Error: {str(e)}"))
-        
-        threading.Thread(target=run_kill_port, daemon=True).start()
+        except asyncio.TimeoutError:
+            self._message("Kill Port Error", "Command timed out", error=True)
+        except Exception as e:
+            self._message("Kill Port Error", f"Error: {str(e)}", error=True)
     
     def _execute_test_zed(self):
         """Execute test_zed.sh via SSH"""
-        def run_test_zed():
-            try:
-                ssh_cmd = ["ssh", "-o", "StrictHostKeyChecking=no", "-o", "LogLevel=ERROR", 
-                          "g1", "bash ~/g1-onboard/test_zed.sh"]
-                
-                result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=30)
+        self.runner.submit(self._run_test_zed())
+    
+    async def _run_test_zed(self):
+        try:
+            returncode, out, err = await self._ssh("bash ~/g1-onboard/test_zed.sh", timeout=30)
+            
+            if returncode == 0:
+                output = self._dialog_text(out) or "Command executed successfully"
+                self._message("Test ZED", f"test_zed.sh executed successfully!\n\nOutput:\n{output}")
+            else:
+                error_msg = self._dialog_text(err or out) or "Unknown error"
+                self._message("Test ZED Error", f"Failed to execute test_zed.sh:\n{error_msg}", error=True)
                 
-                if result.returncode == 0:
-                    output = result.stdout or "Command executed successfully"
-                    self.root.after(0, lambda: messagebox.showinfo("Test ZED", f"test_zed.sh executed successfully!\n\nOutput:\n{output}"))
-                else:
-                    error_msg = result.stderr or result.stdout or "Unknown error"
-                    self.root.after(0, lambda: messagebox.showerror("Test ZED Error", f"Failed to execute test_zed.sh:\n{error_msg}"))
-                    
-            except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: messagebox.showerror("Test ZED Error", "Command timed out"))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Test ZED Error", f"Error: {str(e)}"))
-        
-        threading.Thread(target=run_test_zed, daemon=True).start()
+        except asyncio.TimeoutError:
+            self._message("Test ZED Error", "Command timed out", error=True)
+        except Exception as e:
+            self._message("Test ZED Error", f"Error: {str(e)}", error=True)
     
     def _disable_firewall(self):
         """Disable system firewall"""
         # if messagebox.askyesno("Disable Firewall", "This will disable the system firewall using sudo. Continue?"):
         if True:
-            def disable_firewall():
-                try:
-                    # Use echo to pipe password to sudo
-                    cmd = 'echo "Zyj20011113*" | sudo -S ufw disable'
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-                    
-                    # Update UI in main thread
-                    if result.returncode == 0:
-                        self.root.after(0, lambda: messagebox.showinfo("Firewall", "Firewall disabled successfully!"))
-                    else:
-                        error_msg = result.stderr or result.stdout or "Unknown error"
-                        self.root.after(0, lambda: messagebox.showerror("Firewall Error", f"Failed to disable firewall:\n{error_msg}"))
-                        
-                except subprocess.TimeoutExpired:
-                    self.root.after(0, lambda: messagebox.showerror("Firewall Error", "Command timed out"))
-                except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Firewall Error", f"Error: {str(e)}"))
-            
-            # Run in background thread
-            threading.Thread(target=disable_firewall, daemon=True).start()
+            self.runner.submit(self._run_disable_firewall())
     
-    def _start_g1_servers(self):
-        """Start G1 neck and ZED servers"""
+    async def _run_disable_firewall(self):
         try:
-            # Start neck server
-            if not self.neck_panel.is_running:
-                self.neck_panel.start()
-                time.sleep(1)  # Small delay between starts
+            # Non-interactive: relies on a NOPASSWD sudoers entry (see README) instead of a stored password
+            returncode, out, err = await self._exec(["sudo", "-n", "ufw", "disable"], timeout=30)
             
-            # Start ZED server  
-            if not self.zed_panel.is_running:
-                self.zed_panel.start()
+            if returncode == 0:
+                self._toast("Firewall disabled successfully!")
+            else:
+                error_msg = self._dialog_text(err or out) or "Unknown error"
+                hint = ("\n\nAllow it without a password with a sudoers entry, e.g. in /etc/sudoers.d/twist2:\n"
+                        f"{getpass.getuser()} ALL=(root) NOPASSWD: /usr/sbin/ufw disable")
+                self._message("Firewall Error", f"Failed to disable firewall:\n{error_msg}{hint}", error=True)
                 
-            messagebox.showinfo("G1 Servers", "Starting G1 Neck and ZED servers...")
-            
+        except asyncio.TimeoutError:
+            self._message("Firewall Error", "Command timed out", error=True)
         except Exception as e:
-            messagebox.showerror("G1 Servers Error", f"Failed to start G1 servers: {str(e)}")
+            self._message("Firewall Error", f"Error: {str(e)}", error=True)
+    
+    def _toast(self, message, duration_ms=2000):
+        """Show a non-modal notification that closes itself, so panel output keeps updating meanwhile"""
+        toast = ctk.CTkToplevel(self.root)
+        toast.overrideredirect(True)
+        toast.attributes("-topmost", True)
+        toast.geometry(f"+{self.root.winfo_rootx() + 30}+{self.root.winfo_rooty() + 100}")
+        toast_label = ctk.CTkLabel(toast, text=message, font=get_font(16, "bold"))
+        toast_label.pack(padx=20, pady=10)
+        toast.after(duration_ms, toast.destroy)
+    
+    def _message(self, title, message, error=False):
+        """Non-modal replacement for messagebox: a modal dialog would block the Tk updates and with
+        them the event loop, so panel pipes would stop being drained while it is open"""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        ctk.CTkLabel(dialog, text=message, font=get_font(14), justify="left", wraplength=600,
+                     text_color=self.colors["danger"] if error else None).pack(padx=20, pady=(20, 10))
+        ctk.CTkButton(dialog, text="OK", command=dialog.destroy, width=100,
+                      font=get_font(14, "bold")).pack(pady=(0, 20))
+    
+    def _start_panels(self, panels, title, message, error_message):
+        """Start the panels that are not running yet, all at once on the shared loop.
+        
+        Returns immediately; the result is shown once every process is spawned.
+        """
+        async def start_all():
+            pending = [panel for panel in panels if not panel.is_running]
+            started = await asyncio.gather(*(panel.start_async() for panel in pending))
+            return [panel.title for panel, ok in zip(pending, started) if not ok]
+        
+        task = self.runner.submit(start_all())
+        task.add_done_callback(lambda t: self._show_start_result(t, title, message, error_message))
+    
+    def _show_start_result(self, task, title, message, error_message):
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._message(f"{title} Error", f"{error_message}: {str(error)}", error=True)
+            return
+        failed = task.result()
+        if failed:
+            self._message(f"{title} Error", f"{error_message}: {', '.join(failed)} (see the panel output)", error=True)
+        else:
+            self._toast(message)
+    
+    def _start_g1_servers(self):
+        """Start G1 neck and ZED servers"""
+        self._start_panels((self.neck_panel, self.zed_panel),
+                           "G1 Servers", "Starting G1 Neck and ZED servers...",
+                           "Failed to start G1 servers")
     
     def _start_local_servers(self):
         """Start Sim2Real Deploy, Teleop, and Data Record servers"""
-        try:
-            # Start Sim2Real Deploy server
-            if not self.sim2real_panel.is_running:
-                self.sim2real_panel.start()
-                time.sleep(1)  # Small delay between starts
-            
-            # Start Teleop server
-            if not self.teleop_panel.is_running:
-                self.teleop_panel.start()
-                time.sleep(1)  # Small delay between starts
-            
-            # Start Data Record server
-            if not self.record_panel.is_running:
-                self.record_panel.start()
-                
-            messagebox.showinfo("Local Servers", "Starting Sim2Real Deploy, Teleop, and Data Record servers...")
-            
-        except Exception as e:
-            messagebox.showerror("Local Servers Error", f"Failed to start local servers: {str(e)}")
+        self._start_panels((self.sim2real_panel, self.teleop_panel, self.record_panel),
+                           "Local Servers", "Starting Sim2Real Deploy, Teleop, and Data Record servers...",
+                           "Failed to start local servers")
+    
+    def _on_panel_running_change(self, panel, running):
+        """Track which panels have a live process"""
+        if running:
+            self._running_panels.add(panel)
+        else:
+            self._running_panels.discard(panel)
     
     def _emergency_stop(self):
         """Emergency stop"""
         # if messagebox.askyesno("Emergency Stop", "Kill all running processes?"):
-        for panel in self.all_panels:
-            if panel.is_running:
-                panel.kill()
-        messagebox.showinfo("Emergency Stop", "All processes killed successfully!")
+        # kill() only sends SIGTERM and schedules the SIGKILL check, so every panel is
+        # signalled right away and their grace periods overlap
+        panels = list(self._running_panels)
+        if not panels:
+            self._toast("No processes running")
+            return
+        kill_tasks = [panel.kill() for panel in panels]
+        self._toast(f"Stop signal sent to {len(panels)} processes")
+        self.runner.submit(self._report_emergency_stop(panels, kill_tasks))
+    
+    async def _report_emergency_stop(self, panels, kill_tasks):
+        """Report the outcome once every kill has escalated and run its cleanup"""
+        failed = []
+        for panel, kill_task in zip(panels, kill_tasks):
+            if kill_task is None or not await kill_task:
+                failed.append(panel.title)
+        if self._quit_requested:
+            return  # the window is going away
+        if failed:
+            self._message("Emergency Stop Error", f"Failed to stop: {', '.join(failed)} (see the panel output)", error=True)
+        else:
+            self._toast(f"All {len(panels)} processes stopped")
     
     def run(self):
         """Run application"""
-        self.root.mainloop()
+        self.runner.run(self._main())
+    
+    async def _main(self):
+        await self._update_tk()
+        # Kills still in their grace period get to escalate and run their cleanup command
+        # before the widgets they report to are destroyed
+        kill_tasks = [panel.kill_task for panel in self.all_panels if panel.kill_task is not None]
+        await asyncio.gather(*kill_tasks, return_exceptions=True)
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass  # already destroyed
+        await self._stop_ssh_master()
+    
+    def _request_quit(self):
+        """Hide the window and let _main finish pending kills before destroying it"""
+        self._quit_requested = True
+        self.root.withdraw()
+    
+    async def _update_tk(self, frame_interval=0.016):
+        """Process pending Tk events ~60 times per second in place of mainloop, until the window is closed"""
+        try:
+            while not self._quit_requested:
+                self.root.update()
+                await asyncio.sleep(frame_interval)
+        except tk.TclError:
+            pass  # the window was destroyed
+    
+    async def _stop_ssh_master(self):
+        """Let the SSH master exit once its open sessions end (still running remote panels are not cut off)"""
+        try:
+            await self._exec((*SSH_BASE, "-O", "stop", "g1"), timeout=5)
+        except Exception as e:
+            print(f"Failed to stop SSH master connection: {e}")
 
 
 if __name__ == "__main__":